@@ -37,13 +37,108 @@ in the form of [ 'coordinate_r', 'coordinate_c' ].
 * Note that the action [3, 3] is jumping action, not putting a stone on board (3, 3).
 """
 
+_CELLS = np.array([" □ ", " ■ ", "   "], dtype=object)
+"""
+String of each cell in ''OthelloState.__str__'', indexed by black, white and empty.
+"""
+
+_TABLE_TOP = "┌───┬───┬───┬───┬───┬───┬───┬───┐"
+_TABLE_BOTTOM = "└───┴───┴───┴───┴───┴───┴───┴───┘"
+_VERTICAL_WALL = "│"
+_ROW_SEPARATOR = "\n├   ┼   ┼   ┼   ┼   ┼   ┼   ┼   ┤\n"
+
+def _look(plane: NDArray[np.bool_], dir_r: int, dir_c: int) -> NDArray[np.bool_]:
+    """
+    Return an array whose (r, c) element is the (r + dir_r, c + dir_c) element of
+    ''plane'', where the locations out of board are considered as False.
+    """
+    size = plane.shape[0]
+    shifted = np.zeros_like(plane)
+    shifted[
+        max(-dir_r, 0) : size - max(dir_r, 0), max(-dir_c, 0) : size - max(dir_c, 0)
+    ] = plane[
+        max(dir_r, 0) : size - max(-dir_r, 0), max(dir_c, 0) : size - max(-dir_c, 0)
+    ]
+    return shifted
+
+
+def _can_flip(
+    board: NDArray[np.uint8], r: int, c: int, agent_id: int, dir_id: int
+) -> bool:
+    """
+    Return whether putting a stone of ''agent_id'' on (r, c) flips stones
+    toward the direction ''dir_id''.
+    """
+    dir_r, dir_c = OthelloEnv._DIRS[dir_id]
+    size = board.shape[1]
+    something_to_flip = False
+    for _ in range(1, size):
+        r += dir_r
+        c += dir_c
+        if not (0 <= r < size and 0 <= c < size):
+            return False
+        if board[1 - agent_id][r][c] == 1:
+            something_to_flip = True
+        elif board[agent_id][r][c] == 1:
+            return something_to_flip
+        else:
+            return False
+    return False
+
+
+def _flip_dir(
+    board: NDArray[np.uint8],
+    new_board: NDArray[np.uint8],
+    agent_id: int,
+    r: int,
+    c: int,
+    dir_id: int,
+) -> int:
+    """
+    Flip stones in ''new_board'' toward the direction ''dir_id'' from (r, c),
+    judging by ''board''.
+
+    :returns:
+        The number of flipped stones n, which lie on
+        (r + k * dir_r, c + k * dir_c) for k = 1 ~ n.
+    """
+    dir_r, dir_c = OthelloEnv._DIRS[dir_id]
+    size = board.shape[1]
+    n = 0
+    temp_r = r + dir_r
+    temp_c = c + dir_c
+    while (
+        0 <= temp_r < size
+        and 0 <= temp_c < size
+        and board[1 - agent_id][temp_r][temp_c] == 1
+    ):
+        n += 1
+        temp_r += dir_r
+        temp_c += dir_c
+    if n == 0 or not (0 <= temp_r < size and 0 <= temp_c < size):
+        return 0
+    if board[agent_id][temp_r][temp_c] != 1:
+        return 0
+
+    for k in range(1, n + 1):
+        new_board[1 - agent_id][r + k * dir_r][c + k * dir_c] = 0
+        new_board[agent_id][r + k * dir_r][c + k * dir_c] = 1
+    return n
+
+
+try:
+    from othello_fast import can_flip as _can_flip, flip_dir as _flip_dir
+except ImportError:
+    pass
+
+
 @dataclass
 class OthelloState(BaseState):
     """
     ''OthelloState'' represents the game state.
     """
 
-    board: NDArray[np.int_]
+    board: NDArray[np.uint8]
     """
     Array of shape ``(C, W, H)``,
     where C is channel index
@@ -111,50 +206,14 @@ class OthelloState(BaseState):
         Uses unicode box drawing characters.
         """
 
-        table_top = "┌───┬───┬───┬───┬───┬───┬───┬───┐"
-        vertical_wall = "│"
-        horizontal_wall = "───"
-        left_intersection = "├"
-        middle_intersection = "┼"
-        right_intersection = "┤"
-        left_intersection_bottom = "└"
-        middle_intersection_bottom = "┴"
-        right_intersection_bottom = "┘"
-
-        result = table_top + "\n"
-
-        for r in range(8):
-            board_line = self.board[:, r, :]
-            result += vertical_wall
-            for c in range(8):
-                board_cell = board_line[:, c]
-                if board_cell[0]:
-                    result += " □ "
-                elif board_cell[1]:
-                    result += " ■ "
-                else:
-                    result += "   "
-                if c == 7:
-                    result += vertical_wall
-                    result += "\n"
-                else:
-                    result += " "
-            result += left_intersection_bottom if r == 7 else left_intersection
-            for c in range(8):
-                if r == 7:
-                    result += horizontal_wall
-                    result += (
-                        right_intersection_bottom
-                        if c == 7
-                        else middle_intersection_bottom
-                    )
-                else:
-                    result += "   "
-                    result += right_intersection if c == 7 else middle_intersection
-
-            result += "\n"
+        board = self.board
+        cell_ids = np.where(board[0], 0, np.where(board[1], 1, 2))
+        rows = [
+            _VERTICAL_WALL + " ".join(_CELLS[cell_ids[r]]) + _VERTICAL_WALL
+            for r in range(8)
+        ]
 
-        return result
+        return _TABLE_TOP + "\n" + _ROW_SEPARATOR.join(rows) + "\n" + _TABLE_BOTTOM + "\n"
 
     def perspective(self, agent_id: int) -> NDArray[np.int_]:
         """
@@ -208,7 +267,7 @@ class OthelloState(BaseState):
             Deserialized ``PuoriborState`` object.
         """
         return OthelloState(
-            board=np.array(serialized["board"]),
+            board=np.array(serialized["board"], dtype=np.uint8),
             legal_actions=np.array(serialized["legal_actions"]),
             legal_set=[
                 defaultdict(
@@ -239,6 +298,20 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
     Size (width and height) of the board.
     """
 
+    _DIRS = (
+        (1, 1),
+        (1, 0),
+        (1, -1),
+        (0, -1),
+        (-1, -1),
+        (-1, 0),
+        (-1, 1),
+        (0, 1),
+    )
+    """
+    Directions to walk from a location, indexed by direction ID.
+    """
+
     def step(
         self,
         state: OthelloState,
@@ -280,10 +353,10 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         if pre_step_fn is not None:
             pre_step_fn(state, agent_id, action)
 
-        action = np.asanyarray(action).astype(np.int_)
-        r, c = action
+        r = int(action[0])
+        c = int(action[1])
 
-        if not self._check_in_range(np.array([r, c])):
+        if not self._check_in_range(r, c):
             raise ValueError(f"out of board: {(r, c)}")
         if not 0 <= agent_id <= 1:
             raise ValueError(f"invalid agent_id: {agent_id}")
@@ -299,20 +372,14 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         if r==3 and c==3:
             return state
 
-        new_board = np.copy(state.board)
+        # The compiled kernels only take C-contiguous uint8 boards.
+        board = np.ascontiguousarray(state.board, dtype=np.uint8)
+        new_board = board.copy()
         new_legal_set = copy.deepcopy(state.legal_set)
         new_legal_dict = copy.deepcopy(state.legal_dict)
 
-        directions = (
-            (1, 1),
-            (1, 0),
-            (1, -1),
-            (0, -1),
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, 1),
-        )
+        directions = self._DIRS
+        size = self.board_size
 
         # Put a stone and update its position of board, legal_dict, and legal_set.
         new_board[agent_id][r][c] = 1
@@ -328,7 +395,7 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
             opp_dir_id = (dir_id + 4) % 8
             sur_r = r + dir[0]
             sur_c = c + dir[1]
-            if not self._check_in_range(np.array([sur_r, sur_c])):
+            if not (0 <= sur_r < size and 0 <= sur_c < size):
                 continue
             if (
                 new_board[agent_id][sur_r][sur_c] == 1
@@ -342,69 +409,43 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         # If one legal_set element is deleted, then verify same location of legal_dict
         # and delete it too if needed.
         for dir_id in state.legal_set[agent_id][(r, c)]:
-            stones_to_flip = []
-            temp_r = r
-            temp_c = c
-            for _ in range(1, self.board_size):
-                temp_r += directions[dir_id][0]
-                temp_c += directions[dir_id][1]
-                if not self._check_in_range(np.array([temp_r, temp_c])):
-                    break
-                if state.board[1 - agent_id][temp_r][temp_c] == 1:
-                    stones_to_flip.append((temp_r, temp_c))
-                elif state.board[agent_id][temp_r][temp_c] == 1:
-                    if stones_to_flip:
-                        for stone_r, stone_c in stones_to_flip:
-                            new_board[1 - agent_id][stone_r][stone_c] = 0
-                            new_board[agent_id][stone_r][stone_c] = 1
-                            for temp_dir_id, temp_dir in enumerate(directions):
-                                opp_dir_id = (temp_dir_id + 4) % 8
-                                if temp_dir_id == dir_id or opp_dir_id == dir_id:
-                                    continue
-                                sur_r = stone_r + temp_dir[0]
-                                sur_c = stone_c + temp_dir[1]
-                                if not self._check_in_range(np.array([sur_r, sur_c])):
-                                    continue
-                                if (
-                                    new_board[agent_id][sur_r][sur_c] == 1
-                                    or new_board[1 - agent_id][sur_r][sur_c] == 1
-                                ):
-                                    continue
-                                new_legal_set[1 - agent_id][(sur_r, sur_c)].add(
-                                    opp_dir_id
-                                )
-                                new_legal_set[agent_id][(sur_r, sur_c)].remove(
-                                    opp_dir_id
-                                )
-                                if (sur_r, sur_c) in new_legal_dict[
-                                    agent_id
-                                ] and new_legal_dict[agent_id][
-                                    (sur_r, sur_c)
-                                ] == opp_dir_id:
-                                    del new_legal_dict[agent_id][(sur_r, sur_c)]
-                                if len(new_legal_set[agent_id][(sur_r, sur_c)]) == 0:
-                                    del new_legal_set[agent_id][(sur_r, sur_c)]
-                    break
-                else:
-                    break
+            dir_r, dir_c = directions[dir_id]
+            n = _flip_dir(board, new_board, agent_id, r, c, dir_id)
+            for k in range(1, n + 1):
+                stone_r = r + k * dir_r
+                stone_c = c + k * dir_c
+                for temp_dir_id, temp_dir in enumerate(directions):
+                    opp_dir_id = (temp_dir_id + 4) % 8
+                    if temp_dir_id == dir_id or opp_dir_id == dir_id:
+                        continue
+                    sur_r = stone_r + temp_dir[0]
+                    sur_c = stone_c + temp_dir[1]
+                    if not (0 <= sur_r < size and 0 <= sur_c < size):
+                        continue
+                    if (
+                        new_board[agent_id][sur_r][sur_c] == 1
+                        or new_board[1 - agent_id][sur_r][sur_c] == 1
+                    ):
+                        continue
+                    new_legal_set[1 - agent_id][(sur_r, sur_c)].add(opp_dir_id)
+                    new_legal_set[agent_id][(sur_r, sur_c)].remove(opp_dir_id)
+                    if (sur_r, sur_c) in new_legal_dict[agent_id] and new_legal_dict[
+                        agent_id
+                    ][(sur_r, sur_c)] == opp_dir_id:
+                        del new_legal_dict[agent_id][(sur_r, sur_c)]
+                    if len(new_legal_set[agent_id][(sur_r, sur_c)]) == 0:
+                        del new_legal_set[agent_id][(sur_r, sur_c)]
 
         # Update legal_dict according to new board and legal_set.
         for agent_id in range(2):
             for r, c in new_legal_set[agent_id]:
                 if (r, c) in new_legal_dict[agent_id]:
-                    dir = directions[new_legal_dict[agent_id][(r, c)]]
-                    if not self._can_flip(new_board, r, c, agent_id, dir[0], dir[1]):
+                    dir_id = new_legal_dict[agent_id][(r, c)]
+                    if not _can_flip(new_board, r, c, agent_id, dir_id):
                         del new_legal_dict[agent_id][(r, c)]
                 if (r, c) not in new_legal_dict[agent_id]:
                     for dir_id in new_legal_set[agent_id][(r, c)]:
-                        if self._can_flip(
-                            new_board,
-                            r,
-                            c,
-                            agent_id,
-                            directions[dir_id][0],
-                            directions[dir_id][1],
-                        ):
+                        if _can_flip(new_board, r, c, agent_id, dir_id):
                             new_legal_dict[agent_id][(r, c)] = dir_id
                             break
 
@@ -443,30 +484,7 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
 
         return next_state
 
-    def _can_flip(
-        self,
-        board: NDArray[np.int_],
-        r: int,
-        c: int,
-        agent_id: int,
-        dir_r: int,
-        dir_c: int,
-    ) -> bool:
-        something_to_flip = False
-        for _ in range(1, self.board_size):
-            r += dir_r
-            c += dir_c
-            if not self._check_in_range(np.array([r, c])):
-                return False
-            if board[1 - agent_id][r][c] == 1:
-                something_to_flip = True
-            elif board[agent_id][r][c] == 1:
-                if something_to_flip:
-                    return True
-                return False
-        return False
-
-    def _check_wins(self, board: NDArray[np.int_]) -> NDArray[np.int_]:
+    def _check_wins(self, board: NDArray[np.uint8]) -> NDArray[np.int_]:
         agent0_cnt = np.count_nonzero(board[0])
         agent1_cnt = np.count_nonzero(board[1])
 
@@ -477,12 +495,11 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         else:
             return np.array([0, 0])
 
-    def _check_in_range(self, pos: NDArray[np.int_], bottom_right=None) -> np.bool_:
-        if bottom_right is None:
-            bottom_right = np.array([self.board_size, self.board_size])
-        return np.all(np.logical_and(np.array([0, 0]) <= pos, pos < bottom_right))
+    def _check_in_range(self, r: int, c: int) -> bool:
+        size = self.board_size
+        return 0 <= r < size and 0 <= c < size
 
-    def build_state(self, board: NDArray[np.int_]) -> OthelloState:
+    def build_state(self, board: NDArray[np.uint8]) -> OthelloState:
         """
         Build a state(including legal_set, legal_dict, legal_actions, done and reward)
         from the current board information.
@@ -493,6 +510,7 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         :returns:
             A state which board is same as the input.
         """
+        board = np.ascontiguousarray(board, dtype=np.uint8)
 
         legal_set = [
             defaultdict(set),
@@ -500,50 +518,29 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         ]  # type: list[defaultdict[tuple[int, int], set[int]]]
         legal_dict = [dict(), dict()]  # type: list[dict[tuple[int, int], int]]
 
-        directions = (
-            (1, 1),
-            (1, 0),
-            (1, -1),
-            (0, -1),
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, 1),
-        )
+        directions = self._DIRS
+        size = self.board_size
 
-        for r in range(self.board_size):
-            for c in range(self.board_size):
-                if board[0][r][c] == 0 and board[1][r][c] == 0:
-                    for agent_id in range(2):
-                        for dir_id, dir in enumerate(directions):
-                            flipped = False
-                            something_to_flip = False
-                            temp_r = r
-                            temp_c = c
-                            for _ in range(1, self.board_size):
-                                temp_r += dir[0]
-                                temp_c += dir[1]
-                                if not self._check_in_range(np.array([temp_r, temp_c])):
-                                    break
-                                if board[1 - agent_id][temp_r][temp_c] == 1:
-                                    legal_set[agent_id][(r, c)].add(dir_id)
-                                    something_to_flip = True
-                                elif board[agent_id][temp_r][temp_c] == 1:
-                                    if something_to_flip:
-                                        flipped = True
-                                    break
-                                else:
-                                    break
-                            if flipped:
-                                legal_dict[agent_id][(r, c)] = dir_id
-
-        legal_actions = np.zeros((2, self.board_size, self.board_size), dtype=np.int_)
+        empty = (board[0] == 0) & (board[1] == 0)
+        legal_actions = np.zeros((2, size, size), dtype=np.int_)
+
+        # For every direction, find the locations next to opponent's stones (legal_set)
+        # and the locations which close a line of opponent's stones (legal_dict),
+        # shifting the whole board at once.
         for agent_id in range(2):
-            for r in range(self.board_size):
-                for c in range(self.board_size):
-                    legal_actions[agent_id][r][c] = (
-                        1 if (r, c) in legal_dict[agent_id] else 0
-                    )
+            own = board[agent_id] == 1
+            opp = board[1 - agent_id] == 1
+            for dir_id, (dir_r, dir_c) in enumerate(directions):
+                for r, c in np.argwhere(empty & _look(opp, dir_r, dir_c)).tolist():
+                    legal_set[agent_id][(r, c)].add(dir_id)
+
+                line = opp & _look(own, dir_r, dir_c)
+                for _ in range(size - 3):
+                    line |= opp & _look(line, dir_r, dir_c)
+                flippable = empty & _look(line, dir_r, dir_c)
+                for r, c in np.argwhere(flippable).tolist():
+                    legal_dict[agent_id][(r, c)] = dir_id
+                legal_actions[agent_id] |= flippable
 
         done = False
         reward = np.zeros((2,), dtype=np.int_)
@@ -601,7 +598,8 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
                     [0, 0, 0, 0, 0, 0, 0, 0],
                     [0, 0, 0, 0, 0, 0, 0, 0],
                 ],
-            ]
+            ],
+            dtype=np.uint8,
         )
 
         initial_state = self.build_state(board)
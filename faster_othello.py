@@ -35,13 +35,28 @@ Encoded as an array of shape ''(2,)'',
 in the form of [ 'coordinate_r', 'coordinate_c' ].
 """
 
+_CELLS = np.array([" X ", " O ", "   "], dtype=object)
+"""
+String of each cell in ''OthelloState.__str__'', indexed by black, white and empty.
+"""
+
+_PERSPECTIVE = (np.s_[:], np.s_[::-1])
+"""
+Channel index of ''OthelloState.board'' seen by each agent.
+"""
+
+_TABLE_TOP = "┌───┬───┬───┬───┬───┬───┬───┬───┐"
+_TABLE_BOTTOM = "└───┴───┴───┴───┴───┴───┴───┴───┘"
+_VERTICAL_WALL = "│"
+_ROW_SEPARATOR = "\n├   ┼   ┼   ┼   ┼   ┼   ┼   ┼   ┤\n"
+
 @dataclass
 class OthelloState(BaseState):
     """
     ''OthelloState'' represents the game state.
     """
 
-    board: NDArray[np.int_]
+    board: NDArray[np.uint8]
     """
     Array of shape ``(C, W, H)``,
     where C is channel index
@@ -105,56 +120,18 @@ class OthelloState(BaseState):
         Uses unicode box drawing characters.
         """
 
-        table_top = "┌───┬───┬───┬───┬───┬───┬───┬───┐"
-        vertical_wall = "│"
-        horizontal_wall = "───"
-        left_intersection = "├"
-        middle_intersection = "┼"
-        right_intersection = "┤"
-        left_intersection_bottom = "└"
-        middle_intersection_bottom = "┴"
-        right_intersection_bottom = "┘"
-
-        result = table_top + "\n"
-
-        for r in range(8):
-            board_line = self.board[:, r, :]
-            result += vertical_wall
-            for c in range(8):
-                board_cell = board_line[:, c]
-                if board_cell[0]:
-                    result += " X "
-                elif board_cell[1]:
-                    result += " O "
-                else:
-                    result += "   "
-                if c == 7:
-                    result += vertical_wall
-                    result += "\n"
-                else:
-                    result += " "
-            result += left_intersection_bottom if r == 7 else left_intersection
-            for c in range(8):
-                if r == 7:
-                    result += horizontal_wall
-                    result += (
-                        right_intersection_bottom if c == 7
-                        else middle_intersection_bottom
-                    )
-                else:
-                    result += "   "
-                    result += (
-                        right_intersection if c == 7
-                        else middle_intersection
-                    )
-
-            result += "\n"
+        board = self.board
+        cell_ids = np.where(board[0], 0, np.where(board[1], 1, 2))
+        rows = [
+            _VERTICAL_WALL + " ".join(_CELLS[cell_ids[r]]) + _VERTICAL_WALL
+            for r in range(8)
+        ]
 
-        return result
+        return _TABLE_TOP + "\n" + _ROW_SEPARATOR.join(rows) + "\n" + _TABLE_BOTTOM + "\n"
 
-    def perspective(self, agent_id: int) -> OthelloState:
+    def perspective(self, agent_id: int) -> NDArray[np.uint8]:
         """
-        Return state observed by the agent whose ID is agent_id.
+        Return board observed by the agent whose ID is agent_id.
 
         :arg agent_id:
             The ID of agent to use as base.
@@ -162,41 +139,16 @@ class OthelloState(BaseState):
         :returns:
             The ''board'' channel 0 will contain stones of ''agent_id'',
             and channel 1 will contain stones of opponent.
-            The ''legal_actions'' channel 0 will contain legal actions of ''agent_id'',
-            and channel 1 will contain legal actions of opponent.
-            ''done'' has no difference.
-            ''reward'' will be reversed.
-            Considering that every game starts with 4 stones of fixed position,
-            it returns flipped ''board'' array if ''agent_id'' is 1, and the same goes for ''legal_actions'' array.
+            Channels are swapped as a view, so the board is not copied.
         """
 
-        if agent_id == 0:
-            return self.board
-        
-        reverse_board = np.stack(
-            np.fliplr(self.board[1]),
-            np.fliplr(self.board[0])
-        )
-        reverse_legal_actions = np.stack(
-            np.fliplr(self.legal_actions[1]),
-            np.fliplr(self.legal_actions[0])
-        )
-        reverse_reward = np.fliplr(self.reward)
-
-        reverse_state = OthelloState(
-            board = reverse_board,
-            legal_actions = reverse_legal_actions,
-            done = self.done,
-            reward = reverse_reward
-        )
-        
-        return reverse_state
+        return self.board[_PERSPECTIVE[agent_id]]
 
     def need_jump(self, agent_id: int) -> bool:
         """
         Return whether the agent has no legal action.
         """
-        return np.count_nonzero(self.legal_actions[agent_id]) == 0
+        return len(self.legal_dict[agent_id]) == 0
 
     def to_dict(self) -> Dict:
         """
@@ -221,7 +173,7 @@ class OthelloState(BaseState):
             Deserialized ``PuoriborState`` object.
         """
         return OthelloState(
-            board=np.array(serialized["board"]),
+            board=np.array(serialized["board"], dtype=np.uint8),
             legal_actions=np.array(serialized["legal_actions"]),
             done=serialized["done"],
             reward=np.array(serialized["reward"]),
@@ -238,6 +190,11 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
     Size (width and height) of the board.
     """
 
+    _DIRS = ((1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1))
+    """
+    Directions to walk from a location, indexed by direction ID.
+    """
+
     def step(
         self,
         state: OthelloState,
@@ -279,10 +236,10 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         if pre_step_fn is not None:
             pre_step_fn(state, agent_id, action)
 
-        action = np.asanyarray(action).astype(np.int_)
-        r, c = action
+        r = int(action[0])
+        c = int(action[1])
 
-        if not self._check_in_range(np.array([r, c])):
+        if not self._check_in_range(r, c):
             raise ValueError(f"out of board: {(r, c)}")
         if not 0 <= agent_id <= 1:
             raise ValueError(f"invalid agent_id: {agent_id}")
@@ -295,11 +252,12 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
             else:
                 raise ValueError("There is no stones to flip")
 
-        new_board = np.copy(state.board)
+        new_board = state.board.copy()
         new_legal_set = copy.deepcopy(state.legal_set)
         new_legal_dict = copy.deepcopy(state.legal_dict)
 
-        directions = [(1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1)]
+        directions = self._DIRS
+        size = self.board_size
 
         new_board[agent_id][r][c] = 1
         new_legal_dict[agent_id].pop((r, c))
@@ -313,7 +271,7 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
             opp_dir_id = (dir_id + 4) % 8
             sur_r = r + directions[dir_id][0]
             sur_c = c + directions[dir_id][1]
-            if not self._check_in_range(np.array([sur_r, sur_c])):
+            if not (0 <= sur_r < size and 0 <= sur_c < size):
                 continue
             if new_board[agent_id][sur_r][sur_c] == 1 or new_board[1-agent_id][sur_r][sur_c] == 1:
                 continue
@@ -326,7 +284,7 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
             for _ in range(1, self.board_size):
                 temp_r += directions[dir][0]
                 temp_c += directions[dir][1]
-                if not self._check_in_range(np.array([temp_r, temp_c])):
+                if not (0 <= temp_r < size and 0 <= temp_c < size):
                     break
                 if state.board[1-agent_id][temp_r][temp_c] == 1:
                     stones_to_flip.append((temp_r, temp_c))
@@ -339,7 +297,7 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
                                 opp_dir_id = (dir_id + 4) % 8
                                 sur_r = a_stone[0] + directions[dir_id][0]
                                 sur_c = a_stone[1] + directions[dir_id][1]
-                                if not self._check_in_range(np.array([sur_r, sur_c])):
+                                if not (0 <= sur_r < size and 0 <= sur_c < size):
                                     continue
                                 if new_board[agent_id][sur_r][sur_c] == 1 or new_board[1-agent_id][sur_r][sur_c] == 1:
                                     continue
@@ -386,13 +344,14 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
             post_step_fn(next_state, agent_id, action)
         return next_state
 
-    def _can_flip(self, board: NDArray[np.int_], r: int, c: int, agent_id: int, dir_r: int, dir_c: int) -> bool:
+    def _can_flip(self, board: NDArray[np.uint8], r: int, c: int, agent_id: int, dir_r: int, dir_c: int) -> bool:
         something_to_flip = False
         flipped = False
-        for _ in range(1, self.board_size):
+        size = self.board_size
+        for _ in range(1, size):
             r += dir_r
             c += dir_c
-            if not self._check_in_range(np.array([r, c])):
+            if not (0 <= r < size and 0 <= c < size):
                 break
             if board[1-agent_id][r][c] == 1:
                 something_to_flip = True
@@ -404,7 +363,7 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
                 break
         return flipped
 
-    def _check_wins(self, board: NDArray[np.int_]) -> NDArray[np.int_]:
+    def _check_wins(self, board: NDArray[np.uint8]) -> NDArray[np.int_]:
         agent0_cnt = np.count_nonzero(board[0])
         agent1_cnt = np.count_nonzero(board[1])
         
@@ -412,10 +371,9 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         elif agent0_cnt < agent1_cnt: return np.array([-1, 1])
         else: return np.array([0, 0])
 
-    def _check_in_range(self, pos: NDArray[np.int_], bottom_right=None) -> np.bool_:
-        if bottom_right is None:
-            bottom_right = np.array([self.board_size, self.board_size])
-        return np.all(np.logical_and(np.array([0, 0]) <= pos, pos < bottom_right))
+    def _check_in_range(self, r: int, c: int) -> bool:
+        size = self.board_size
+        return 0 <= r < size and 0 <= c < size
 
     def initialize_state(self) -> OthelloState:
         """
@@ -447,7 +405,7 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
             [0,0,0,0,0,0,0,0],
             [0,0,0,0,0,0,0,0],
             [0,0,0,0,0,0,0,0]],
-        ])
+        ], dtype=np.uint8)
 
         legal_actions = np.array([
             [[0,0,0,0,0,0,0,0],
@@ -3,7 +3,7 @@ Othello game example with faster othello environment.
 Prints board state to stdout with random agents by default.
 """
 
-import re
+import argparse
 import sys
 
 sys.path.append("../")
@@ -24,22 +24,28 @@ class RandomAgent(BaseAgent):
 
     def _get_all_actions(self, state: faster_othello.OthelloState):
         actions = []
-        for coordinate_x in range(faster_othello.OthelloEnv.board_size):
-            for coordinate_y in range(faster_othello.OthelloEnv.board_size):
-                action = [coordinate_x, coordinate_y]
-                if state.legal_actions[self.agent_id][coordinate_x][coordinate_y]:
-                    actions.append(action)
+        append = actions.append
+        size = faster_othello.OthelloEnv.board_size
+        legal_actions = state.legal_actions[self.agent_id]
+        for coordinate_x in range(size):
+            for coordinate_y in range(size):
+                if legal_actions[coordinate_x, coordinate_y]:
+                    append([coordinate_x, coordinate_y])
         return actions
 
     def __call__(self, state: faster_othello.OthelloState) -> faster_othello.OthelloAction:
         actions = self._get_all_actions(state)
         return self._rng.choice(actions)
 
+_ASCII_TABLE = str.maketrans(
+    {**dict.fromkeys("┌┬┐├┼┤└┴┘╋", "+"), **dict.fromkeys("─━", "-"), **dict.fromkeys("│┃", "|")}
+)
+
 def fallback_to_ascii(s: str) -> str:
     try:
         s.encode(sys.stdout.encoding)
     except UnicodeEncodeError:
-        s = re.sub("[┌┬┐├┼┤└┴┘╋]", "+", re.sub("[─━]", "-", re.sub("[│┃]", "|", s)))
+        s = s.translate(_ASCII_TABLE)
     return s
 
 
@@ -48,21 +54,27 @@ def colorize_walls(s: str) -> str:
         "┃", Fore.RED + "┃" + Style.RESET_ALL
     )
 
-def run():
+def render(state: faster_othello.OthelloState) -> None:
+    write = sys.stdout.write
+    write("\x1b[1;1H\n")
+    write(fallback_to_ascii(colorize_walls(str(state))))
+    write("\n")
+    sys.stdout.flush()
+
+def run(quiet: bool = False):
     assert faster_othello.OthelloEnv.env_id == RandomAgent.env_id
     colorama.init()
 
     state = faster_othello.OthelloEnv().initialize_state()
     agents = [RandomAgent(1), RandomAgent(0)]
 
-    print("\x1b[2J")
+    if not quiet:
+        sys.stdout.write("\x1b[2J\n")
+        render(state)
 
     it = 0
     while not state.done:
 
-        print("\x1b[1;1H")
-        print(fallback_to_ascii(colorize_walls(str(state))))
-
         for agent in agents:
             
             if state.need_jump(agent.agent_id): continue
@@ -70,10 +82,9 @@ def run():
             action = agent(state)
             state = faster_othello.OthelloEnv().step(state, agent.agent_id, action)
 
-            print("\x1b[1;1H")
-            print(fallback_to_ascii(colorize_walls(str(state))))
-
-            a = input()
+            if not quiet:
+                render(state)
+                a = input()
 
             if state.done:
                 print(f"agent {np.argmax(state.reward)} won in {it} iters")
@@ -82,4 +93,8 @@ def run():
         it += 1
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--quiet", action="store_true", help="play without rendering or waiting for input"
+    )
+    run(quiet=parser.parse_args().quiet)
\ No newline at end of file
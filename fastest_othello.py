@@ -26,6 +26,15 @@ if sys.version_info < (3, 10):
 else:
     from typing import TypeAlias
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Fallback when numba is not installed: kernels run as plain Python.
+        """
+        return lambda fn: fn
+
 from fights.base import BaseEnv, BaseState
 
 OthelloAction: TypeAlias = ArrayLike
@@ -35,21 +44,80 @@ Encoded as an array of shape ''(2,)'',
 in the form of [ 'coordinate_r', 'coordinate_c' ].
 """
 
+_CELLS = np.array(["   ", " □ ", " ■ "], dtype=object)
+"""
+String of each cell in ''OthelloState.__str__'', indexed by the value of ''board''.
+"""
+
+_PERSPECTIVE = (np.array([0, 1, 2], dtype=np.int8), np.array([0, 2, 1], dtype=np.int8))
+"""
+Lookup table of ''OthelloState.board'' values seen by each agent.
+"""
+
+_TABLE_TOP = "┌───┬───┬───┬───┬───┬───┬───┬───┐"
+_TABLE_BOTTOM = "└───┴───┴───┴───┴───┴───┴───┴───┘"
+_VERTICAL_WALL = "│"
+_ROW_SEPARATOR = "\n├   ┼   ┼   ┼   ┼   ┼   ┼   ┼   ┤\n"
+
+@njit(cache=True)
+def _can_flip(board: NDArray[np.int8], r: int, c: int, agent_id: int, dir_r: int, dir_c: int) -> bool:
+    """
+    Return whether putting a stone of ''agent_id'' on (r, c) flips stones toward (dir_r, dir_c).
+    """
+    own = agent_id + 1
+    opp = 2 - agent_id
+    something_to_flip = False
+    for _ in range(1, 8):
+        r += dir_r
+        c += dir_c
+        if r < 0 or r >= 8 or c < 0 or c >= 8:
+            return False
+        if board[r, c] == opp:
+            something_to_flip = True
+        elif board[r, c] == own:
+            return something_to_flip
+        else:
+            return False
+    return False
+
+@njit(cache=True)
+def _flip_line(board: NDArray[np.int8], new_board: NDArray[np.int8], agent_id: int, r: int, c: int, dir_r: int, dir_c: int) -> int:
+    """
+    Flip stones in ''new_board'' toward (dir_r, dir_c) from (r, c), judging by ''board''.
+
+    :returns:
+        The number of flipped stones, which lie on (r + k * dir_r, c + k * dir_c) for k = 1 ~ n.
+    """
+    own = agent_id + 1
+    opp = 2 - agent_id
+    n = 0
+    temp_r = r + dir_r
+    temp_c = c + dir_c
+    while 0 <= temp_r < 8 and 0 <= temp_c < 8 and board[temp_r, temp_c] == opp:
+        n += 1
+        temp_r += dir_r
+        temp_c += dir_c
+    if n == 0 or not (0 <= temp_r < 8 and 0 <= temp_c < 8) or board[temp_r, temp_c] != own:
+        return 0
+    for k in range(1, n + 1):
+        new_board[r + k * dir_r, c + k * dir_c] = own
+    return n
+
 @dataclass
 class OthelloState(BaseState):
     """
     ''OthelloState'' represents the game state.
     """
 
-    board: NDArray[np.int_]
+    board: NDArray[np.int8]
     """
-    Array of shape ``(C, W, H)``,
-    where C is channel index
-    and W, H is board width, height.
+    Array of shape ``(W, H)``,
+    where W, H is board width, height.
 
-    Channels
-        - ''C = 0'': one-hot encoded stones of agent 0. (black)
-        - ''C = 1'': one-hot encoded stones of agent 1. (white)
+    Values
+        - ''0'': empty.
+        - ''1'': stone of agent 0. (black)
+        - ''2'': stone of agent 1. (white)
     """
 
     legal_actions: NDArray[np.int_]
@@ -105,92 +173,26 @@ class OthelloState(BaseState):
         Uses unicode box drawing characters.
         """
 
-        table_top = "┌───┬───┬───┬───┬───┬───┬───┬───┐"
-        vertical_wall = "│"
-        horizontal_wall = "───"
-        left_intersection = "├"
-        middle_intersection = "┼"
-        right_intersection = "┤"
-        left_intersection_bottom = "└"
-        middle_intersection_bottom = "┴"
-        right_intersection_bottom = "┘"
-
-        result = table_top + "\n"
-
-        for r in range(8):
-            board_line = self.board[:, r, :]
-            result += vertical_wall
-            for c in range(8):
-                board_cell = board_line[:, c]
-                if board_cell[0]:
-                    result += " □ "
-                elif board_cell[1]:
-                    result += " ■ "
-                else:
-                    result += "   "
-                if c == 7:
-                    result += vertical_wall
-                    result += "\n"
-                else:
-                    result += " "
-            result += left_intersection_bottom if r == 7 else left_intersection
-            for c in range(8):
-                if r == 7:
-                    result += horizontal_wall
-                    result += (
-                        right_intersection_bottom if c == 7
-                        else middle_intersection_bottom
-                    )
-                else:
-                    result += "   "
-                    result += (
-                        right_intersection if c == 7
-                        else middle_intersection
-                    )
-
-            result += "\n"
-
-        return result
-
-    def perspective(self, agent_id: int) -> OthelloState:
+        rows = [
+            _VERTICAL_WALL + " ".join(_CELLS[self.board[r]]) + _VERTICAL_WALL
+            for r in range(8)
+        ]
+
+        return _TABLE_TOP + "\n" + _ROW_SEPARATOR.join(rows) + "\n" + _TABLE_BOTTOM + "\n"
+
+    def perspective(self, agent_id: int) -> NDArray[np.int8]:
         """
-        Return state observed by the agent whose ID is agent_id.
+        Return board observed by the agent whose ID is agent_id.
 
         :arg agent_id:
             The ID of agent to use as base.
 
         :returns:
-            The ''board'' channel 0 will contain stones of ''agent_id'',
-            and channel 1 will contain stones of opponent.
-            The ''legal_actions'' channel 0 will contain legal actions of ''agent_id'',
-            and channel 1 will contain legal actions of opponent.
-            ''done'' has no difference.
-            ''reward'' will be reversed.
-            Considering that every game starts with 4 stones of fixed position,
-            it returns flipped ''board'' array if ''agent_id'' is 1, and the same goes for ''legal_actions'' array.
+            The ''board'' where ''1'' is a stone of ''agent_id'',
+            and ''2'' is a stone of opponent.
         """
 
-        if agent_id == 0:
-            return self.board
-        
-        reverse_board = np.stack(
-            np.fliplr(self.board[1]),
-            np.fliplr(self.board[0])
-        )
-        reverse_legal_actions = np.stack(
-            np.fliplr(self.legal_actions[1]),
-            np.fliplr(self.legal_actions[0])
-        )
-        reverse_reward = np.fliplr(self.reward)
-
-        reverse_state = OthelloState(
-            board = reverse_board,
-            legal_actions = reverse_legal_actions,
-            done = self.done,
-            reward = reverse_reward
-        )
-        
-        return reverse_state
+        return _PERSPECTIVE[agent_id][self.board]
 
     def need_jump(self, agent_id: int) -> bool:
         """
@@ -221,7 +223,7 @@ class OthelloState(BaseState):
             Deserialized ``PuoriborState`` object.
         """
         return OthelloState(
-            board=np.array(serialized["board"]),
+            board=np.array(serialized["board"], dtype=np.int8),
             legal_actions=np.array(serialized["legal_actions"]),
             done=serialized["done"],
             reward=np.array(serialized["reward"]),
@@ -238,6 +240,11 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
     Size (width and height) of the board.
     """
 
+    _DIRS = ((1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1))
+    """
+    Directions to walk from a location, indexed by direction ID.
+    """
+
     def step(
         self,
         state: OthelloState,
@@ -279,30 +286,34 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         if pre_step_fn is not None:
             pre_step_fn(state, agent_id, action)
 
-        action = np.asanyarray(action).astype(np.int_)
-        r, c = action
+        r = int(action[0])
+        c = int(action[1])
 
-        if not self._check_in_range(np.array([r, c])):
+        if not self._check_in_range(r, c):
             raise ValueError(f"out of board: {(r, c)}")
         if not 0 <= agent_id <= 1:
             raise ValueError(f"invalid agent_id: {agent_id}")
         
+        own = agent_id + 1
+        opp = 2 - agent_id
+
         if state.legal_actions[agent_id][r][c] == 0:
-            if state.board[1-agent_id][r][c]:
+            if state.board[r, c] == opp:
                 raise ValueError("cannot put a stone on opponent's stone")
-            elif state.board[agent_id][r][c]:
+            elif state.board[r, c] == own:
                 raise ValueError("cannot put a stone on another stone")
             else:
                 raise ValueError("There is no stone to flip")
 
-        new_board = np.copy(state.board)
+        new_board = state.board.copy()
         new_legal_set = copy.deepcopy(state.legal_set)
         new_legal_dict = copy.deepcopy(state.legal_dict)
 
-        directions = ((1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1))
+        directions = self._DIRS
+        size = self.board_size
 
         # Put a stone and update its position of board, legal_dict, and legal_set.
-        new_board[agent_id][r][c] = 1
+        new_board[r, c] = own
         del new_legal_dict[agent_id][(r, c)]
         del new_legal_set[agent_id][(r, c)]
         if (r, c) in new_legal_set[1-agent_id]:
@@ -315,60 +326,47 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
             opp_dir_id = (dir_id + 4) % 8
             sur_r = r + dir[0]
             sur_c = c + dir[1]
-            if not self._check_in_range(np.array([sur_r, sur_c])):
+            if not (0 <= sur_r < size and 0 <= sur_c < size):
                 continue
-            if new_board[agent_id][sur_r][sur_c] == 1 or new_board[1-agent_id][sur_r][sur_c] == 1:
+            if new_board[sur_r, sur_c] != 0:
                 continue
             new_legal_set[1-agent_id][(sur_r, sur_c)].add(opp_dir_id)
 
         # Flip the stones and Update 8 surroundings(legal_set) of the locations where stones flipped.
         # If one legal_set element is deleted, then verify same location of legal_dict and delete it too if needed.
         for dir_id in state.legal_set[agent_id][(r,c)]:
-            stones_to_flip = []
-            temp_r = r
-            temp_c = c
-            for _ in range(1, self.board_size):
-                temp_r += directions[dir_id][0]
-                temp_c += directions[dir_id][1]
-                if not self._check_in_range(np.array([temp_r, temp_c])):
-                    break
-                if state.board[1-agent_id][temp_r][temp_c] == 1:
-                    stones_to_flip.append((temp_r, temp_c))
-                elif state.board[agent_id][temp_r][temp_c] == 1:
-                    if stones_to_flip:
-                        for (stone_r, stone_c) in stones_to_flip:
-                            new_board[1-agent_id][stone_r][stone_c] = 0
-                            new_board[agent_id][stone_r][stone_c] = 1
-                            for temp_dir_id, temp_dir in enumerate(directions):
-                                opp_dir_id = (temp_dir_id + 4) % 8
-                                if temp_dir_id == dir_id or opp_dir_id == dir_id:
-                                    continue
-                                sur_r = stone_r + temp_dir[0]
-                                sur_c = stone_c + temp_dir[1]
-                                if not self._check_in_range(np.array([sur_r, sur_c])):
-                                    continue
-                                if new_board[agent_id][sur_r][sur_c] == 1 or new_board[1-agent_id][sur_r][sur_c] == 1:
-                                    continue
-                                new_legal_set[1-agent_id][(sur_r, sur_c)].add(opp_dir_id)
-                                new_legal_set[agent_id][(sur_r, sur_c)].remove(opp_dir_id)
-                                if (sur_r, sur_c) in new_legal_dict[agent_id] and new_legal_dict[agent_id][(sur_r, sur_c)] == opp_dir_id:
-                                    del new_legal_dict[agent_id][(sur_r, sur_c)]
-                                if len(new_legal_set[agent_id][(sur_r, sur_c)]) == 0:
-                                    del new_legal_set[agent_id][(sur_r, sur_c)] 
-                    break
-                else:
-                    break
+            dir_r, dir_c = directions[dir_id]
+            n = _flip_line(state.board, new_board, agent_id, r, c, dir_r, dir_c)
+            for k in range(1, n + 1):
+                stone_r = r + k * dir_r
+                stone_c = c + k * dir_c
+                for temp_dir_id, temp_dir in enumerate(directions):
+                    opp_dir_id = (temp_dir_id + 4) % 8
+                    if temp_dir_id == dir_id or opp_dir_id == dir_id:
+                        continue
+                    sur_r = stone_r + temp_dir[0]
+                    sur_c = stone_c + temp_dir[1]
+                    if not (0 <= sur_r < size and 0 <= sur_c < size):
+                        continue
+                    if new_board[sur_r, sur_c] != 0:
+                        continue
+                    new_legal_set[1-agent_id][(sur_r, sur_c)].add(opp_dir_id)
+                    new_legal_set[agent_id][(sur_r, sur_c)].remove(opp_dir_id)
+                    if (sur_r, sur_c) in new_legal_dict[agent_id] and new_legal_dict[agent_id][(sur_r, sur_c)] == opp_dir_id:
+                        del new_legal_dict[agent_id][(sur_r, sur_c)]
+                    if len(new_legal_set[agent_id][(sur_r, sur_c)]) == 0:
+                        del new_legal_set[agent_id][(sur_r, sur_c)] 
         
         # Update legal_dict according to new board and legal_set.
         for agent_id in range(2):
             for r, c in new_legal_set[agent_id]:
                 if (r, c) in new_legal_dict[agent_id]:
                     dir = directions[new_legal_dict[agent_id][(r,c)]]
-                    if not self._can_flip(new_board, r, c, agent_id, dir[0], dir[1]):
+                    if not _can_flip(new_board, r, c, agent_id, dir[0], dir[1]):
                         del new_legal_dict[agent_id][(r, c)]
                 if (r, c) not in new_legal_dict[agent_id]:
                     for dir_id in new_legal_set[agent_id][(r, c)]:
-                        if self._can_flip(new_board, r, c, agent_id, directions[dir_id][0], directions[dir_id][1]):
+                        if _can_flip(new_board, r, c, agent_id, directions[dir_id][0], directions[dir_id][1]):
                             new_legal_dict[agent_id][(r, c)] = dir_id
                             break
 
@@ -399,34 +397,17 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         
         return next_state
 
-    def _can_flip(self, board: NDArray[np.int_], r: int, c: int, agent_id: int, dir_r: int, dir_c: int) -> bool:
-        something_to_flip = False
-        for _ in range(1, self.board_size):
-            r += dir_r
-            c += dir_c
-            if not self._check_in_range(np.array([r, c])):
-                return False
-            if board[1-agent_id][r][c] == 1:
-                something_to_flip = True
-            elif board[agent_id][r][c] == 1:
-                if something_to_flip:
-                    return True
-                return False
-            else:
-                return False
-
-    def _check_wins(self, board: NDArray[np.int_]) -> NDArray[np.int_]:
-        agent0_cnt = np.count_nonzero(board[0])
-        agent1_cnt = np.count_nonzero(board[1])
+    def _check_wins(self, board: NDArray[np.int8]) -> NDArray[np.int_]:
+        agent0_cnt = np.count_nonzero(board == 1)
+        agent1_cnt = np.count_nonzero(board == 2)
         
         if agent0_cnt > agent1_cnt: return np.array([1, -1])
         elif agent0_cnt < agent1_cnt: return np.array([-1, 1])
         else: return np.array([0, 0])
 
-    def _check_in_range(self, pos: NDArray[np.int_], bottom_right=None) -> np.bool_:
-        if bottom_right is None:
-            bottom_right = np.array([self.board_size, self.board_size])
-        return np.all(np.logical_and(np.array([0, 0]) <= pos, pos < bottom_right))
+    def _check_in_range(self, r: int, c: int) -> bool:
+        size = self.board_size
+        return 0 <= r < size and 0 <= c < size
 
     def initialize_state(self) -> OthelloState:
         """
@@ -442,23 +423,15 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
             )
 
         board = np.array([
-            [[0,0,0,0,0,0,0,0],
             [0,0,0,0,0,0,0,0],
             [0,0,0,0,0,0,0,0],
-            [0,0,0,0,1,0,0,0],
+            [0,0,0,0,0,0,0,0],
+            [0,0,0,2,1,0,0,0],
             [0,0,0,1,1,0,0,0],
             [0,0,0,0,1,0,0,0],
             [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0]],
-            [[0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
             [0,0,0,0,0,0,0,0],
-            [0,0,0,1,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0]],
-        ])
+        ], dtype=np.int8)
 
         legal_actions = np.array([
             [[0,0,0,0,0,0,0,0],
@@ -12,11 +12,11 @@ Directions
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import sys
 import numpy as np
 
-from typing import Callable, Optional, Dict
+from typing import Callable, Optional, Dict, Tuple
 from numpy.typing import ArrayLike, NDArray
 
 if sys.version_info < (3, 10):
@@ -33,32 +33,184 @@ Encoded as an array of shape ''(2,)'',
 in the form of [ 'coordinate_r', 'coordinate_c' ].
 """
 
+_CELLS = np.array([" X ", " O ", "   "], dtype=object)
+"""
+String of each cell in ''OthelloState.__str__'', indexed by black, white and empty.
+"""
+
+_PERSPECTIVE = (np.s_[:], np.s_[::-1])
+"""
+Channel index of ''OthelloState.board'' seen by each agent.
+"""
+
+_TABLE_TOP = "┌───┬───┬───┬───┬───┬───┬───┬───┐"
+_TABLE_BOTTOM = "└───┴───┴───┴───┴───┴───┴───┴───┘"
+_VERTICAL_WALL = "│"
+_ROW_SEPARATOR = "\n├   ┼   ┼   ┼   ┼   ┼   ┼   ┼   ┤\n"
+
+_FULL = 0xFFFFFFFFFFFFFFFF
+_NOT_COL_0 = 0xFEFEFEFEFEFEFEFE
+_NOT_COL_7 = 0x7F7F7F7F7F7F7F7F
+
+_SHIFTS = (
+    (9, _NOT_COL_0),
+    (8, _FULL),
+    (7, _NOT_COL_7),
+    (-1, _NOT_COL_7),
+    (-9, _NOT_COL_7),
+    (-8, _FULL),
+    (-7, _NOT_COL_0),
+    (1, _NOT_COL_0),
+)
+"""
+Bitboard counterparts of the directions
+(1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1),
+in the form of ( 'shift', 'mask' ).
+The mask clears the bits which wrapped around to the other side of the board.
+"""
+
+
+def _build_rays(dir_r: int, dir_c: int) -> Tuple[int, ...]:
+    rays = []
+    for sq in range(64):
+        ray = 0
+        r = sq // 8 + dir_r
+        c = sq % 8 + dir_c
+        while 0 <= r < 8 and 0 <= c < 8:
+            ray |= 1 << (r * 8 + c)
+            r += dir_r
+            c += dir_c
+        rays.append(ray)
+    return tuple(rays)
+
+
+_RAYS_ASCENDING = tuple(
+    _build_rays(dir_r, dir_c) for dir_r, dir_c in ((1, 1), (1, 0), (1, -1), (0, 1))
+)
+_RAYS_DESCENDING = tuple(
+    _build_rays(dir_r, dir_c) for dir_r, dir_c in ((0, -1), (-1, -1), (-1, 0), (-1, 1))
+)
+"""
+Bitboards of the locations seen from each location toward each direction,
+indexed by ( 'direction', 'r * 8 + c' ).
+Ascending rays only contain higher bits than the location, and descending rays lower bits.
+"""
+
+
+def _flips(own: int, opp: int, sq: int) -> int:
+    """
+    Return the bitboard of opponent's stones flipped by putting a stone on bit ''sq''.
+    Looks up the rays from ''sq'' and finds the nearest location on each ray
+    which is not an opponent's stone; the stones in between are flipped if it is own stone.
+    """
+    flips = 0
+    for rays in _RAYS_ASCENDING:
+        ray = rays[sq]
+        blockers = ray & ~opp
+        if blockers:
+            nearest = blockers & -blockers
+            if nearest & own:
+                flips |= ray & (nearest - 1)
+    for rays in _RAYS_DESCENDING:
+        ray = rays[sq]
+        blockers = ray & ~opp
+        if blockers:
+            nearest = 1 << (blockers.bit_length() - 1)
+            if nearest & own:
+                flips |= ray & ~((nearest << 1) - 1)
+    return flips
+
+
+def _legal_moves_bb(own: int, opp: int) -> Tuple[int, int]:
+    """
+    Return the bitboards of empty locations where putting a stone flips something,
+    for the owner of ''own'' and for the owner of ''opp''.
+    All 64 locations are computed in parallel by smearing each side's stones
+    through the other side's stones, one direction at a time.
+    """
+    empty = ~(own | opp) & _FULL
+    own_legal = 0
+    opp_legal = 0
+    for shift, mask in _SHIFTS:
+        if shift > 0:
+            own_line = opp & (own << shift) & mask
+            opp_line = own & (opp << shift) & mask
+            for _ in range(5):
+                own_line |= opp & (own_line << shift) & mask
+                opp_line |= own & (opp_line << shift) & mask
+            own_legal |= empty & (own_line << shift) & mask
+            opp_legal |= empty & (opp_line << shift) & mask
+        else:
+            shift = -shift
+            own_line = opp & (own >> shift) & mask
+            opp_line = own & (opp >> shift) & mask
+            for _ in range(5):
+                own_line |= opp & (own_line >> shift) & mask
+                opp_line |= own & (opp_line >> shift) & mask
+            own_legal |= empty & (own_line >> shift) & mask
+            opp_legal |= empty & (opp_line >> shift) & mask
+    return own_legal, opp_legal
+
+
+def _apply_and_regen(own: int, opp: int, sq: int) -> Tuple[int, int, int, int]:
+    """
+    Put own stone on bit ''sq'' and flip the captured stones,
+    then compute the legal moves of both sides on the new board in the same pass.
+
+    :returns:
+        A tuple of ( 'own', 'opp', 'own_legal', 'opp_legal' ) after the move.
+    """
+    flips = _flips(own, opp, sq)
+    own |= (1 << sq) | flips
+    opp &= ~flips
+
+    own_legal, opp_legal = _legal_moves_bb(own, opp)
+    return own, opp, own_legal, opp_legal
+
+
+def _unpack(bb: int) -> NDArray[np.uint8]:
+    """
+    Unpack a bitboard into an array of shape ''(8, 8)''.
+    """
+    return np.unpackbits(
+        np.array([bb], dtype="<u8").view(np.uint8), bitorder="little"
+    ).reshape(8, 8)
+
+
+def _popcount(bb: int) -> int:
+    return bin(bb).count("1")
+
+
+_INITIAL_BLACK = 0x0000101810000000
+_INITIAL_WHITE = 0x0000000008000000
+_INITIAL_LEGAL = _legal_moves_bb(_INITIAL_BLACK, _INITIAL_WHITE)
+"""
+Bitboards of the opening position, shared by every ''initialize_state'' call.
+"""
+
+
 @dataclass
 class OthelloState(BaseState):
     """
     ''OthelloState'' represents the game state.
+    Stones are stored as bitboards,
+    where bit ''r * 8 + c'' stands for the location (r, c).
     """
 
-    board: NDArray[np.int_]
+    black: int
     """
-    Array of shape ``(C, W, H)``,
-    where C is channel index
-    and W, H is board width, height.
-
-    Channels
-        - ''C = 0'': one-hot encoded stones of agent 0. (black)
-        - ''C = 1'': one-hot encoded stones of agent 1. (white)
+    Bitboard of the stones of agent 0. (black)
     """
 
-    legal_actions: NDArray[np.int_]
+    white: int
+    """
+    Bitboard of the stones of agent 1. (white)
     """
-    Array of shape ''(C, W, H)'',
-    where C is channel index
-    and W, H is board width, height.
 
-    Channels
-        - ''C = 0'': one-hot encoded possible positions of agent 0. (black)
-        - ''C = 1'': one-hot encoded possible positions of agent 1. (white)
+    legal: Tuple[int, int]
+    """
+    Tuple of length 2,
+    where each element is the bitboard of possible positions of each agent.
     """
 
     done: bool = False
@@ -66,7 +218,9 @@ class OthelloState(BaseState):
     Boolean value indicating wheter the game is done.
     """
 
-    reward: NDArray[np.int_] = np.array([0, 0])
+    reward: NDArray[np.int_] = field(
+        default_factory=lambda: np.zeros((2,), dtype=np.int_)
+    )
     """
     Array of shape ''(2,)'',
     where each value indicates the reward of each agent.
@@ -77,62 +231,52 @@ class OthelloState(BaseState):
         - Draw or not done yet : 0
     """
 
+    @property
+    def board(self) -> NDArray[np.uint8]:
+        """
+        Array of shape ``(C, W, H)``,
+        where C is channel index
+        and W, H is board width, height.
+        Unpacked from the bitboards on demand.
+
+        Channels
+            - ''C = 0'': one-hot encoded stones of agent 0. (black)
+            - ''C = 1'': one-hot encoded stones of agent 1. (white)
+        """
+        return np.stack((_unpack(self.black), _unpack(self.white)))
+
+    @property
+    def legal_actions(self) -> NDArray[np.uint8]:
+        """
+        Array of shape ''(C, W, H)'',
+        where C is channel index
+        and W, H is board width, height.
+        Unpacked from the bitboards on demand.
+
+        Channels
+            - ''C = 0'': one-hot encoded possible positions of agent 0. (black)
+            - ''C = 1'': one-hot encoded possible positions of agent 1. (white)
+        """
+        return np.stack((_unpack(self.legal[0]), _unpack(self.legal[1])))
+
     def __str__(self) -> str:
         """
         Generate a human-readable string representation of the board.
         Uses unicode box drawing characters.
         """
 
-        table_top = "┌───┬───┬───┬───┬───┬───┬───┬───┐"
-        vertical_wall = "│"
-        horizontal_wall = "───"
-        left_intersection = "├"
-        middle_intersection = "┼"
-        right_intersection = "┤"
-        left_intersection_bottom = "└"
-        middle_intersection_bottom = "┴"
-        right_intersection_bottom = "┘"
-
-        result = table_top + "\n"
-
-        for r in range(8):
-            board_line = self.board[:, r, :]
-            result += vertical_wall
-            for c in range(8):
-                board_cell = board_line[:, c]
-                if board_cell[0]:
-                    result += " X "
-                elif board_cell[1]:
-                    result += " O "
-                else:
-                    result += "   "
-                if c == 7:
-                    result += vertical_wall
-                    result += "\n"
-                else:
-                    result += " "
-            result += left_intersection_bottom if r == 7 else left_intersection
-            for c in range(8):
-                if r == 7:
-                    result += horizontal_wall
-                    result += (
-                        right_intersection_bottom if c == 7
-                        else middle_intersection_bottom
-                    )
-                else:
-                    result += "   "
-                    result += (
-                        right_intersection if c == 7
-                        else middle_intersection
-                    )
-
-            result += "\n"
-
-        return result
-
-    def perspective(self, agent_id: int) -> OthelloState:
+        board = self.board
+        cell_ids = np.where(board[0], 0, np.where(board[1], 1, 2))
+        rows = [
+            _VERTICAL_WALL + " ".join(_CELLS[cell_ids[r]]) + _VERTICAL_WALL
+            for r in range(8)
+        ]
+
+        return _TABLE_TOP + "\n" + _ROW_SEPARATOR.join(rows) + "\n" + _TABLE_BOTTOM + "\n"
+
+    def perspective(self, agent_id: int) -> NDArray[np.uint8]:
         """
-        Return state observed by the agent whose ID is agent_id.
+        Return board observed by the agent whose ID is agent_id.
 
         :arg agent_id:
             The ID of agent to use as base.
@@ -140,41 +284,17 @@ class OthelloState(BaseState):
         :returns:
             The ''board'' channel 0 will contain stones of ''agent_id'',
             and channel 1 will contain stones of opponent.
-            The ''legal_actions'' channel 0 will contain legal actions of ''agent_id'',
-            and channel 1 will contain legal actions of opponent.
-            ''done'' has no difference.
-            ''reward'' will be reversed.
-            Considering that every game starts with 4 stones of fixed position,
-            it returns flipped ''board'' array if ''agent_id'' is 1, and the same goes for ''legal_actions'' array.
+            The board is unpacked from the bitboards on every call,
+            and the channels of that fresh array are swapped as a view.
         """
 
-        if agent_id == 0:
-            return self.board
-        
-        reverse_board = np.stack(
-            np.fliplr(self.board[1]),
-            np.fliplr(self.board[0])
-        )
-        reverse_legal_actions = np.stack(
-            np.fliplr(self.legal_actions[1]),
-            np.fliplr(self.legal_actions[0])
-        )
-        reverse_reward = np.fliplr(self.reward)
-
-        reverse_state = OthelloState(
-            board = reverse_board,
-            legal_actions = reverse_legal_actions,
-            done = self.done,
-            reward = reverse_reward
-        )
-        
-        return reverse_state
+        return self.board[_PERSPECTIVE[agent_id]]
 
     def need_jump(self, agent_id: int) -> bool:
         """
         Return whether the agent has no legal action.
         """
-        return np.count_nonzero(self.legal_actions[agent_id]) == 0
+        return self.legal[agent_id] == 0
 
     def to_dict(self) -> Dict:
         """
@@ -183,8 +303,9 @@ class OthelloState(BaseState):
             A serialized dict.
         """
         return {
-            "board": self.board.tolist(),
-            "legal_actions": self.legal_actions.tolist(),
+            "black": self.black,
+            "white": self.white,
+            "legal": list(self.legal),
             "done": self.done,
             "reward": self.reward.tolist(),
         }
@@ -199,8 +320,9 @@ class OthelloState(BaseState):
             Deserialized ``PuoriborState`` object.
         """
         return OthelloState(
-            board=np.array(serialized["board"]),
-            legal_actions=np.array(serialized["legal_actions"]),
+            black=serialized["black"],
+            white=serialized["white"],
+            legal=tuple(serialized["legal"]),
             done=serialized["done"],
             reward=np.array(serialized["reward"]),
         )
@@ -257,91 +379,46 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
         if pre_step_fn is not None:
             pre_step_fn(state, agent_id, action)
 
-        action = np.asanyarray(action).astype(np.int_)
-        r, c = action
+        r = int(action[0])
+        c = int(action[1])
 
-        if not self._check_in_range(np.array([r, c])):
+        if not self._check_in_range(r, c):
             raise ValueError(f"out of board: {(r, c)}")
         if not 0 <= agent_id <= 1:
             raise ValueError(f"invalid agent_id: {agent_id}")
         
-        if state.legal_actions[agent_id][r][c] == 0:
-            if state.board[1-agent_id][r][c]:
+        sq = r * 8 + c
+        move = 1 << sq
+        if agent_id == 0:
+            own, opp = state.black, state.white
+        else:
+            own, opp = state.white, state.black
+
+        if not state.legal[agent_id] & move:
+            if opp & move:
                 raise ValueError("cannot put a stone on opponent's stone")
-            elif state.board[agent_id][r][c]:
+            elif own & move:
                 raise ValueError("cannot put a stone on another stone")
             else:
                 raise ValueError("There is no stones to flip")
 
-        board = np.copy(state.board)
-
-        directions = [(1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1)]
-
-        for dir in directions:
-            stones_to_flip = []
-            temp_r = r
-            temp_c = c
-            for _ in range(1, self.board_size):
-                temp_r += dir[0]
-                temp_c += dir[1]
-                if not self._check_in_range(np.array([temp_r, temp_c])):
-                    break
-                if state.board[1-agent_id][temp_r][temp_c] == 1:
-                    stones_to_flip.append((temp_r, temp_c))
-                elif state.board[agent_id][temp_r][temp_c] == 1:
-                    if stones_to_flip:
-                        for a_stone in stones_to_flip:
-                            board[1-agent_id][a_stone[0]][a_stone[1]] = 0
-                            board[agent_id][a_stone[0]][a_stone[1]] = 1
-                    break
-                else:
-                    break
-        board[agent_id][r][c] = 1
-
-        legal_actions = np.zeros((2, self.board_size, self.board_size), dtype=np.int_)
-        
-        for r in range(self.board_size):
-            for c in range(self.board_size):
-
-                if board[0][r][c] == 0 and board[1][r][c] == 0:
-
-                    for agent_id in range(2):
-
-                        flipped = False
-                        for dir in directions:
-
-                            something_to_flip = False
-                            temp_r = r
-                            temp_c = c
-                            for _ in range(1, self.board_size):
-
-                                temp_r += dir[0]
-                                temp_c += dir[1]
-                                if not self._check_in_range(np.array([temp_r, temp_c])):
-                                    break
-                                if board[1-agent_id][temp_r][temp_c] == 1:
-                                    something_to_flip = True
-                                elif board[agent_id][temp_r][temp_c] == 1:
-                                    if something_to_flip:
-                                        flipped = True
-                                    break
-                                else:
-                                    break
-                            if flipped:
-                                break
-                        
-                        if flipped:
-                            legal_actions[agent_id][r][c] = 1
-        
+        own, opp, own_legal, opp_legal = _apply_and_regen(own, opp, sq)
+
+        if agent_id == 0:
+            black, white, legal = own, opp, (own_legal, opp_legal)
+        else:
+            black, white, legal = opp, own, (opp_legal, own_legal)
+
         done = False
-        reward = np.zeros((2,))
-        if np.count_nonzero(legal_actions) == 0:
+        reward = np.zeros((2,), dtype=np.int_)
+        if not legal[0] and not legal[1]:
             done = True
-            reward = self._check_wins(board)
-        
+            reward = self._check_wins(black, white)
+
         next_state = OthelloState(
-            board = board,
-            legal_actions = legal_actions,
+            black = black,
+            white = white,
+            legal = legal,
             done = done,
             reward = reward
         )
@@ -349,18 +426,17 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
             post_step_fn(next_state, agent_id, action)
         return next_state
 
-    def _check_wins(self, board: NDArray[np.int_]) -> NDArray[np.int_]:
-        agent0_cnt = np.count_nonzero(board[0])
-        agent1_cnt = np.count_nonzero(board[1])
+    def _check_wins(self, black: int, white: int) -> NDArray[np.int_]:
+        agent0_cnt = _popcount(black)
+        agent1_cnt = _popcount(white)
         
         if agent0_cnt > agent1_cnt: return np.array([1, -1])
         elif agent0_cnt < agent1_cnt: return np.array([-1, 1])
         else: return np.array([0, 0])
 
-    def _check_in_range(self, pos: NDArray[np.int_], bottom_right=None) -> np.bool_:
-        if bottom_right is None:
-            bottom_right = np.array([self.board_size, self.board_size])
-        return np.all(np.logical_and(np.array([0, 0]) <= pos, pos < bottom_right))
+    def _check_in_range(self, r: int, c: int) -> bool:
+        size = self.board_size
+        return 0 <= r < size and 0 <= c < size
 
     def initialize_state(self) -> OthelloState:
         """
@@ -375,49 +451,12 @@ class OthelloEnv(BaseEnv[OthelloState, OthelloAction]):
                 "initialize state manually"
             )
 
-        board = np.array([
-            [[0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,1,0,0,0],
-            [0,0,0,1,1,0,0,0],
-            [0,0,0,0,1,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0]],
-            [[0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,1,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0]],
-        ])
-
-        legal_actions = np.array([
-            [[0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,1,0,0,0,0],
-            [0,0,1,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0]],
-            [[0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,1,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,1,0,1,0,0],
-            [0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0]],
-        ])
-
         initial_state = OthelloState(
-            board = board,
-            legal_actions = legal_actions,
+            black = _INITIAL_BLACK,
+            white = _INITIAL_WHITE,
+            legal = _INITIAL_LEGAL,
             done = False,
-            reward = np.zeros((2,))
+            reward = np.zeros((2,), dtype=np.int_)
         )
 
-        return initial_state
\ No newline at end of file
+        return initial_state
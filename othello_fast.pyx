@@ -0,0 +1,86 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+C kernels for the direction walks of complete_othello.
+Build in place with ``python setup.py build_ext --inplace``.
+Boards are ``(C, W, H)`` uint8 arrays as described in :obj:'complete_othello.OthelloState'.
+"""
+
+cdef int DIRS[8][2]
+for _dir_id, (_dir_r, _dir_c) in enumerate(
+    ((1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1), (0, 1))
+):
+    DIRS[_dir_id][0] = _dir_r
+    DIRS[_dir_id][1] = _dir_c
+
+
+def can_flip(
+    const unsigned char[:, :, ::1] board,
+    int r,
+    int c,
+    int agent_id,
+    int dir_id,
+):
+    """
+    Return whether putting a stone of ''agent_id'' on (r, c) flips stones
+    toward the direction ''dir_id''.
+    """
+    cdef int size = board.shape[1]
+    cdef int dir_r = DIRS[dir_id][0]
+    cdef int dir_c = DIRS[dir_id][1]
+    cdef bint something_to_flip = False
+
+    r += dir_r
+    c += dir_c
+    while 0 <= r < size and 0 <= c < size:
+        if board[1 - agent_id, r, c] == 1:
+            something_to_flip = True
+        elif board[agent_id, r, c] == 1:
+            return something_to_flip
+        else:
+            return False
+        r += dir_r
+        c += dir_c
+    return False
+
+
+def flip_dir(
+    const unsigned char[:, :, ::1] board,
+    unsigned char[:, :, ::1] new_board,
+    int agent_id,
+    int r,
+    int c,
+    int dir_id,
+):
+    """
+    Flip stones in ''new_board'' toward the direction ''dir_id'' from (r, c),
+    judging by ''board''.
+
+    :returns:
+        The number of flipped stones n, which lie on
+        (r + k * dir_r, c + k * dir_c) for k = 1 ~ n.
+    """
+    cdef int size = board.shape[1]
+    cdef int dir_r = DIRS[dir_id][0]
+    cdef int dir_c = DIRS[dir_id][1]
+    cdef int n = 0
+    cdef int k
+    cdef int temp_r = r + dir_r
+    cdef int temp_c = c + dir_c
+
+    while (
+        0 <= temp_r < size
+        and 0 <= temp_c < size
+        and board[1 - agent_id, temp_r, temp_c] == 1
+    ):
+        n += 1
+        temp_r += dir_r
+        temp_c += dir_c
+    if n == 0 or not (0 <= temp_r < size and 0 <= temp_c < size):
+        return 0
+    if board[agent_id, temp_r, temp_c] != 1:
+        return 0
+
+    for k in range(1, n + 1):
+        new_board[1 - agent_id, r + k * dir_r, c + k * dir_c] = 0
+        new_board[agent_id, r + k * dir_r, c + k * dir_c] = 1
+    return n
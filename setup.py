@@ -0,0 +1,10 @@
+"""
+Build the optional C kernels used by complete_othello.
+
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(ext_modules=cythonize("othello_fast.pyx"))
@@ -3,7 +3,10 @@ Othello Environment Speed Test
 """
 
 import numpy as np
+import random
 import time
+from typing import List, Tuple, Union
+from numpy.typing import NDArray
 
 from fights.base import BaseAgent
 import faster_othello
@@ -11,95 +14,66 @@ import fastest_othello
 import othello
 import complete_othello
 
-class RandomAgent(BaseAgent):
-    env_id = ("othello", 0)  # type: ignore
-
-    def __init__(self, agent_id: int, seed: int = 0) -> None:
-        self.agent_id = agent_id  # type: ignore
-        self._rng = np.random.default_rng(seed)
-
-    def _get_all_actions(self, state: othello.OthelloState):
-        actions = []
-        for coordinate_x in range(othello.OthelloEnv.board_size):
-            for coordinate_y in range(othello.OthelloEnv.board_size):
-                action = [coordinate_x, coordinate_y]
-                if state.legal_actions[self.agent_id][coordinate_x][coordinate_y]:
-                    actions.append(action)
-        return actions
-
-    def __call__(self, state: othello.OthelloState) -> othello.OthelloAction:
-        actions = self._get_all_actions(state)
-        return self._rng.choice(actions)
-
-class Faster_RandomAgent(BaseAgent):
-    env_id = ("othello", 0)  # type: ignore
-
-    def __init__(self, agent_id: int, seed: int = 0) -> None:
-        self.agent_id = agent_id  # type: ignore
-        self._rng = np.random.default_rng(seed)
-
-    def _get_all_actions(self, state: faster_othello.OthelloState):
-        actions = []
-        for coordinate_x in range(faster_othello.OthelloEnv.board_size):
-            for coordinate_y in range(faster_othello.OthelloEnv.board_size):
-                action = [coordinate_x, coordinate_y]
-                if state.legal_actions[self.agent_id][coordinate_x][coordinate_y]:
-                    actions.append(action)
-        return actions
+AnyOthelloState = Union[
+    othello.OthelloState,
+    faster_othello.OthelloState,
+    fastest_othello.OthelloState,
+    complete_othello.OthelloState,
+]
 
-    def __call__(self, state: faster_othello.OthelloState) -> faster_othello.OthelloAction:
-        actions = self._get_all_actions(state)
-        return self._rng.choice(actions)
-
-class Fastest_RandomAgent(BaseAgent):
+class RandomAgent(BaseAgent):
     env_id = ("othello", 0)  # type: ignore
 
     def __init__(self, agent_id: int, seed: int = 0) -> None:
         self.agent_id = agent_id  # type: ignore
-        self._rng = np.random.default_rng(seed)
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._batch_rng = None
 
-    def _get_all_actions(self, state: fastest_othello.OthelloState):
-        actions = []
-        for coordinate_x in range(fastest_othello.OthelloEnv.board_size):
-            for coordinate_y in range(fastest_othello.OthelloEnv.board_size):
-                action = [coordinate_x, coordinate_y]
-                if state.legal_actions[self.agent_id][coordinate_x][coordinate_y]:
-                    actions.append(action)
-        return actions
+    def _get_all_actions(self, state: AnyOthelloState) -> NDArray[np.intp]:
+        return np.argwhere(state.legal_actions[self.agent_id])
 
-    def __call__(self, state: fastest_othello.OthelloState) -> fastest_othello.OthelloAction:
+    def __call__(self, state: AnyOthelloState) -> othello.OthelloAction:
         actions = self._get_all_actions(state)
-        return self._rng.choice(actions)
-
-class Complete_RandomAgent(BaseAgent):
-    env_id = ("othello", 0)  # type: ignore
-
-    def __init__(self, agent_id: int, seed: int = 0) -> None:
-        self.agent_id = agent_id  # type: ignore
-        self._rng = np.random.default_rng(seed)
-
-    def _get_all_actions(self, state: complete_othello.OthelloState):
+        return actions[self._rng.randrange(len(actions))]
+
+    def sample_actions(self, state: AnyOthelloState, size: int) -> NDArray[np.intp]:
+        """
+        Draw ''size'' legal actions uniformly with replacement in one batch.
+
+        :returns:
+            A ``(size, 2)`` array of coordinates, or a ``(0, 2)`` array
+            if the agent has no legal action.
+        """
+        actions = np.asarray(self._get_all_actions(state), dtype=np.intp).reshape(-1, 2)
+        if len(actions) == 0:
+            return actions
+        if self._batch_rng is None:
+            self._batch_rng = np.random.default_rng(self._seed)
+        return actions[self._batch_rng.integers(0, len(actions), size=size)]
+
+class Bitboard_RandomAgent(RandomAgent):
+
+    def _get_all_actions(self, state: othello.OthelloState) -> List[Tuple[int, int]]:
         actions = []
-        for coordinate_x in range(complete_othello.OthelloEnv.board_size):
-            for coordinate_y in range(complete_othello.OthelloEnv.board_size):
-                action = [coordinate_x, coordinate_y]
-                if state.legal_actions[self.agent_id][coordinate_x][coordinate_y]:
-                    actions.append(action)
+        append = actions.append
+        legal = state.legal[self.agent_id]
+        while legal:
+            sq = (legal & -legal).bit_length() - 1
+            legal &= legal - 1
+            append((sq >> 3, sq & 7))
         return actions
 
-    def __call__(self, state: complete_othello.OthelloState) -> complete_othello.OthelloAction:
-        actions = self._get_all_actions(state)
-        return self._rng.choice(actions)
-
 def run_original():
     assert othello.OthelloEnv.env_id == RandomAgent.env_id
 
     start = time.time()
 
+    env = othello.OthelloEnv()
     for game in range(100):
 
-        state = othello.OthelloEnv().initialize_state()
-        agents = [RandomAgent(1, game), RandomAgent(0, game)]
+        state = env.initialize_state()
+        agents = [Bitboard_RandomAgent(1, game), Bitboard_RandomAgent(0, game)]
 
         it = 0
         while not state.done:
@@ -109,7 +83,7 @@ def run_original():
                 if state.need_jump(agent.agent_id): continue
 
                 action = agent(state)
-                state = othello.OthelloEnv().step(state, agent.agent_id, action)
+                state = env.step(state, agent.agent_id, action)
 
                 if state.done:
                     break
@@ -125,10 +99,11 @@ def run_faster():
 
     start = time.time()
 
+    env = faster_othello.OthelloEnv()
     for game in range(100):
 
-        state = faster_othello.OthelloEnv().initialize_state()
-        agents = [Faster_RandomAgent(1, game), Faster_RandomAgent(0, game)]
+        state = env.initialize_state()
+        agents = [RandomAgent(1, game), RandomAgent(0, game)]
 
         it = 0
         while not state.done:
@@ -138,7 +113,7 @@ def run_faster():
                 if state.need_jump(agent.agent_id): continue
 
                 action = agent(state)
-                state = faster_othello.OthelloEnv().step(state, agent.agent_id, action)
+                state = env.step(state, agent.agent_id, action)
 
                 if state.done:
                     break
@@ -154,10 +129,11 @@ def run_fastest():
 
     start = time.time()
 
+    env = fastest_othello.OthelloEnv()
     for game in range(100):
 
-        state = fastest_othello.OthelloEnv().initialize_state()
-        agents = [Fastest_RandomAgent(1, game), Fastest_RandomAgent(0, game)]
+        state = env.initialize_state()
+        agents = [RandomAgent(1, game), RandomAgent(0, game)]
 
         it = 0
         while not state.done:
@@ -167,7 +143,7 @@ def run_fastest():
                 if state.need_jump(agent.agent_id): continue
 
                 action = agent(state)
-                state = fastest_othello.OthelloEnv().step(state, agent.agent_id, action)
+                state = env.step(state, agent.agent_id, action)
 
                 if state.done:
                     break
@@ -183,10 +159,11 @@ def run_complete():
 
     start = time.time()
 
+    env = complete_othello.OthelloEnv()
     for game in range(100):
 
-        state = complete_othello.OthelloEnv().initialize_state()
-        agents = [Complete_RandomAgent(1, game), Complete_RandomAgent(0, game)]
+        state = env.initialize_state()
+        agents = [RandomAgent(1, game), RandomAgent(0, game)]
 
         it = 0
         while not state.done:
@@ -194,7 +171,7 @@ def run_complete():
             for agent in agents:
 
                 action = agent(state)
-                state = complete_othello.OthelloEnv().step(state, agent.agent_id, action)
+                state = env.step(state, agent.agent_id, action)
 
                 if state.done:
                     break
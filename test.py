@@ -3,7 +3,6 @@ Othello game example.
 Prints board state to stdout with random agents by default.
 """
 
-import re
 import sys
 
 sys.path.append("../")
@@ -24,22 +23,28 @@ class RandomAgent(BaseAgent):
 
     def _get_all_actions(self, state: complete_othello.OthelloState):
         actions = []
-        for coordinate_x in range(complete_othello.OthelloEnv.board_size):
-            for coordinate_y in range(complete_othello.OthelloEnv.board_size):
-                action = [coordinate_x, coordinate_y]
-                if state.legal_actions[self.agent_id][coordinate_x][coordinate_y]:
-                    actions.append(action)
+        append = actions.append
+        size = complete_othello.OthelloEnv.board_size
+        legal_actions = state.legal_actions[self.agent_id]
+        for coordinate_x in range(size):
+            for coordinate_y in range(size):
+                if legal_actions[coordinate_x, coordinate_y]:
+                    append([coordinate_x, coordinate_y])
         return actions
 
     def __call__(self, state: complete_othello.OthelloState) -> complete_othello.OthelloAction:
         actions = self._get_all_actions(state)
         return self._rng.choice(actions)
 
+_ASCII_TABLE = str.maketrans(
+    {**dict.fromkeys("┌┬┐├┼┤└┴┘╋", "+"), **dict.fromkeys("─━", "-"), **dict.fromkeys("│┃", "|")}
+)
+
 def fallback_to_ascii(s: str) -> str:
     try:
         s.encode(sys.stdout.encoding)
     except UnicodeEncodeError:
-        s = re.sub("[┌┬┐├┼┤└┴┘╋]", "+", re.sub("[─━]", "-", re.sub("[│┃]", "|", s)))
+        s = s.translate(_ASCII_TABLE)
     return s
 
 def run():